@@ -38,9 +38,16 @@ class MultiBit(Mechanism):
             m = self.m
 
         # sample features for perturbation
-        BigS = torch.rand_like(x).topk(m, dim=1).indices
-        s = torch.zeros_like(x, dtype=torch.bool).scatter(1, BigS, True)
-        del BigS
+        if m == d:
+            s = torch.ones_like(x, dtype=torch.bool)
+        elif m == 1:
+            BigS = torch.randint(d, (n, 1), device=x.device)
+        else:
+            BigS = torch.rand_like(x).topk(m, dim=1).indices
+
+        if m < d:
+            s = torch.zeros_like(x, dtype=torch.bool).scatter_(1, BigS, True)
+            del BigS
 
         # perturb sampled features
         em = math.exp(self.eps / m)
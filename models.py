@@ -16,6 +16,8 @@ class KProp(MessagePassing):
         self.normalize = normalize
         self.cached = cached
         self._cached_x = None
+        self._cached_adj_t = None
+        self._cached_adj_t_src = None
 
     def forward(self, x, adj_t):
         if self._cached_x is None or not self.cached:
@@ -27,11 +29,7 @@ class KProp(MessagePassing):
         if self.K <= 0:
             return x
 
-        if self.normalize:
-            adj_t = gcn_norm(adj_t, add_self_loops=False)
-
-        if self.add_self_loops:
-            adj_t = adj_t.set_diag()
+        adj_t = self.preprocess_adjacency(adj_t)
 
         for k in range(self.K):
             x = self.propagate(adj_t, x=x)
@@ -39,6 +37,25 @@ class KProp(MessagePassing):
         x = self.transform(x)
         return x
 
+    def preprocess_adjacency(self, adj_t):
+        if self.cached:  # propagation runs only once
+            return self.normalize_adjacency(adj_t)
+
+        if self._cached_adj_t_src is not adj_t:  # normalize each graph only once
+            self._cached_adj_t_src = adj_t
+            self._cached_adj_t = self.normalize_adjacency(adj_t)
+
+        return self._cached_adj_t
+
+    def normalize_adjacency(self, adj_t):
+        if self.normalize:
+            adj_t = gcn_norm(adj_t, add_self_loops=False)
+
+        if self.add_self_loops:
+            adj_t = adj_t.set_diag()
+
+        return adj_t
+
     def message_and_aggregate(self, adj_t, x):  # noqa
         return matmul(adj_t, x, reduce=self.aggr)
 
@@ -156,7 +173,7 @@ class NodeClassifier(torch.nn.Module):
 
     @staticmethod
     def cross_entropy_loss(p_y, y, weighted=False):
-        y_onehot = F.one_hot(y.argmax(dim=1))
+        y_onehot = F.one_hot(y.argmax(dim=1), num_classes=p_y.size(1))
         loss = -torch.log(p_y + 1e-20) * y_onehot
         loss *= y if weighted else 1
         loss = loss.sum(dim=1).mean()
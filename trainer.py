@@ -62,8 +62,8 @@ class Trainer:
                 if num_epochs_without_improvement >= self.patience > 0:
                     break
 
-            # display metrics on progress bar
-            epoch_progbar.set_postfix(metrics)
+            # display metrics on progress bar (redraw is left to tqdm's own rate limit)
+            epoch_progbar.set_postfix(metrics, refresh=False)
 
         if self.logger:
             self.logger.log_summary(best_metrics)
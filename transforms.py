@@ -84,7 +84,8 @@ class OneHotDegree:
     def __call__(self, data):
         degree = data.adj_t.sum(dim=0).long()
         degree.clamp_(max=self.max_degree)
-        data.x = F.one_hot(degree, num_classes=self.max_degree + 1).float()  # add 1 for zero degree
+        data.x = torch.zeros(degree.size(0), self.max_degree + 1, device=degree.device)  # add 1 for zero degree
+        data.x.scatter_(1, degree.unsqueeze(1), 1.0)
         return data
 
 
@@ -97,8 +98,9 @@ class Normalize:
         alpha = data.x.min(dim=0)[0]
         beta = data.x.max(dim=0)[0]
         delta = beta - alpha
-        data.x = (data.x - alpha) * (self.max - self.min) / delta + self.min
-        data.x = data.x[:, torch.nonzero(delta, as_tuple=False).squeeze()]  # remove features with delta = 0
+        keep = delta > 0  # remove features with delta = 0
+        scale = (self.max - self.min) / delta[keep]
+        data.x = (data.x[:, keep] - alpha[keep]).mul_(scale).add_(self.min)
         return data
 
 